@@ -9,6 +9,11 @@ from statsmodels.graphics.tsaplots import plot_acf
 import plotly.express as px
 import plotly.graph_objects as go
 
+try:
+    from src.rolling_kernels import rolling_std
+except ImportError:  # Running this file directly from src/
+    from rolling_kernels import rolling_std
+
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__)) 
 DATA_DIR = os.path.join(BASE_DIR, "..", "data") 
@@ -48,7 +53,7 @@ class ExploratoryDataAnalysis:
         """Computes and plots Bollinger Bands"""
         print("Generating Bollinger Bands visualization...")
         self.df["ma_20"] = self.df["close"].rolling(window=20).mean()
-        self.df["std_20"] = self.df["close"].rolling(window=20).std()
+        self.df["std_20"] = rolling_std(self.df["close"], 20)
         self.df["upper_band"] = self.df["ma_20"] + (self.df["std_20"] * 2)
         self.df["lower_band"] = self.df["ma_20"] - (self.df["std_20"] * 2)
 
@@ -70,7 +75,7 @@ class ExploratoryDataAnalysis:
     def plot_volatility_trend(self):
         """Computes and plots volatility trend"""
         print("Generating volatility trend visualization...")
-        self.df["volatility"] = self.df["close"].pct_change().rolling(window=30).std()
+        self.df["volatility"] = rolling_std(self.df["close"].pct_change(), 30)
         fig_volatility = px.line(self.df, x=self.df.index, y="volatility", title="Volatility Trend (30-day Rolling)")
         fig_volatility.write_html(os.path.join(EDA_DIR, "volatility_trend.html"))
 
@@ -2,6 +2,11 @@ import os
 import pandas as pd
 import numpy as np
 
+try:
+    from src.rolling_kernels import rolling_median, rolling_std
+except ImportError:  # Running this file directly from src/
+    from rolling_kernels import rolling_median, rolling_std
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__)) 
 DATA_DIR = os.path.join(BASE_DIR, "..", "data")
 RAW_DIR = os.path.join(DATA_DIR, "raw")  
@@ -43,7 +48,7 @@ class DataPreprocessor:
         df["diff_close"] = df["close"].diff()
 
         # Rolling Median (Better than simple moving average)
-        df["rolling_median_10"] = df["close"].rolling(window=10).median()
+        df["rolling_median_10"] = rolling_median(df["close"], 10)
 
         # Moving Averages
         df["ma_3"] = df["close"].rolling(window=3).mean()
@@ -54,8 +59,8 @@ class DataPreprocessor:
         df["momentum_10"] = df["close"].diff(10)
 
         # Volatility Features
-        df["volatility_10"] = df["diff_close"].rolling(window=10).std()
-        df["volatility_30"] = df["diff_close"].rolling(window=30).std()
+        df["volatility_10"] = rolling_std(df["diff_close"], 10)
+        df["volatility_30"] = rolling_std(df["diff_close"], 30)
 
         # Volatility Ratio (New Feature)
         df["volatility_ratio_10"] = df["volatility_10"] / df["close"]
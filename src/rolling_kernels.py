@@ -0,0 +1,175 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# Numba is optional: without it the kernels fall back to vectorised NumPy
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _rolling_median_numpy(values, window):
+    """Pure-NumPy rolling median (NaN until the window is full or if it holds a non-finite value)"""
+    values = np.where(np.isfinite(values), values, np.nan)
+    out = np.full(values.shape[0], np.nan)
+    if values.shape[0] >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        out[window - 1:] = np.median(windows, axis=1)
+    return out
+
+
+def _rolling_std_numpy(values, window, ddof):
+    """Pure-NumPy rolling standard deviation (NaN until the window is full or if it holds a non-finite value)"""
+    values = np.where(np.isfinite(values), values, np.nan)
+    out = np.full(values.shape[0], np.nan)
+    if values.shape[0] >= window and window > ddof:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        std = np.std(windows, axis=1, ddof=ddof)
+        # Constant windows: report an exact zero, as pandas does
+        std[windows.max(axis=1) == windows.min(axis=1)] = 0.0
+        out[window - 1:] = std
+    return out
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(nogil=True, cache=True)
+    def _rolling_median_numba(values, window):
+        """Rolling median over a sorted window buffer (binary-search insert/remove)"""
+        n = values.shape[0]
+        out = np.full(n, np.nan)
+        buf = np.empty(window + 1)  # room for the incoming value before the outgoing one is removed
+        size = 0  # number of finite values currently in the buffer
+        nan_count = 0
+
+        for i in range(n):
+            # Insert the incoming value, keeping the buffer sorted
+            x = values[i]
+            if not np.isfinite(x):
+                nan_count += 1
+            else:
+                pos = np.searchsorted(buf[:size], x)
+                buf[pos + 1:size + 1] = buf[pos:size].copy()
+                buf[pos] = x
+                size += 1
+
+            # Remove the value that leaves the window
+            if i >= window:
+                old = values[i - window]
+                if not np.isfinite(old):
+                    nan_count -= 1
+                else:
+                    pos = np.searchsorted(buf[:size], old)
+                    buf[pos:size - 1] = buf[pos + 1:size].copy()
+                    size -= 1
+
+            if i >= window - 1 and nan_count == 0:
+                mid = window // 2
+                if window % 2 == 1:
+                    out[i] = buf[mid]
+                else:
+                    out[i] = 0.5 * (buf[mid - 1] + buf[mid])
+        return out
+
+    @njit(nogil=True, cache=True)
+    def _rolling_std_numba(values, window, ddof):
+        """Rolling standard deviation using Welford's add/remove updates.
+
+        Values are shifted by a recent sample so the updates work at the scale of the
+        spread rather than the level of the series, and mean/M2 are recomputed with an
+        exact two-pass sum every `window` steps so rounding error cannot accumulate.
+        Very short windows (w=2, 3) over nearly equal values still lose relative
+        precision, as any float64 variance does.
+        """
+        n = values.shape[0]
+        out = np.full(n, np.nan)
+        count = 0
+        shift = 0.0
+        mean = 0.0  # mean of the shifted values
+        m2 = 0.0
+        nan_count = 0
+        prev = np.nan
+        same_run = 0  # length of the trailing run of identical values
+
+        for i in range(n):
+            # Add the incoming value
+            x = values[i]
+            if not np.isfinite(x):
+                nan_count += 1
+            else:
+                if x == prev:
+                    same_run += 1
+                else:
+                    same_run = 1
+                    prev = x
+                if count == 0:
+                    shift = x
+                count += 1
+                delta = (x - shift) - mean
+                mean += delta / count
+                m2 += delta * ((x - shift) - mean)
+
+            # Remove the value that leaves the window
+            if i >= window:
+                old = values[i - window]
+                if not np.isfinite(old):
+                    nan_count -= 1
+                else:
+                    count -= 1
+                    if count == 0:
+                        mean = 0.0
+                        m2 = 0.0
+                    else:
+                        delta = (old - shift) - mean
+                        mean -= delta / count
+                        m2 -= delta * ((old - shift) - mean)
+
+            if i >= window - 1 and nan_count == 0:
+                # Periodically re-anchor the shift and recompute mean/M2 exactly
+                if (i + 1) % window == 0:
+                    shift = x
+                    total = 0.0
+                    for j in range(i - window + 1, i + 1):
+                        total += values[j] - shift
+                    mean = total / window
+                    m2 = 0.0
+                    for j in range(i - window + 1, i + 1):
+                        d = (values[j] - shift) - mean
+                        m2 += d * d
+
+                if count > ddof:
+                    if same_run >= count:
+                        # Constant window: report an exact zero, as pandas does
+                        out[i] = 0.0
+                    else:
+                        # Clamp tiny negative values caused by floating-point drift
+                        if m2 < 0.0:
+                            m2 = 0.0
+                        out[i] = np.sqrt(m2 / (count - ddof))
+        return out
+
+def rolling_median(values, window):
+    """Rolling median matching pandas `rolling(window).median()`; returns a float64 array"""
+    if window < 1:
+        raise ValueError(f"window must be a positive integer, got {window}")
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _rolling_median_numba(values, window)
+    return _rolling_median_numpy(values, window)
+
+
+def rolling_std(values, window, ddof=1):
+    """Rolling standard deviation matching pandas `rolling(window).std()`; returns a float64 array"""
+    if window < 1:
+        raise ValueError(f"window must be a positive integer, got {window}")
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _rolling_std_numba(values, window, ddof)
+    return _rolling_std_numpy(values, window, ddof)
+
+
+def rolling_many(func, series_list, window, max_workers=None):
+    """Applies a rolling kernel to many series in threads (the compiled kernels release the GIL)"""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda values: func(values, window), series_list))
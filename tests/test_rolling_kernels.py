@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import rolling_kernels
+from src.rolling_kernels import rolling_many, rolling_median, rolling_std
+
+WINDOWS = [1, 2, 10, 20, 30]
+
+
+def _random_with_gaps(rng):
+    """Random walk rounded to create ties, with NaNs and infinities sprinkled in"""
+    values = np.round(5 + np.cumsum(rng.normal(0, 0.05, 400)), 2)
+    values[rng.choice(400, 8, replace=False)] = np.nan
+    values[rng.choice(400, 2, replace=False)] = np.inf
+    values[rng.choice(400, 1)] = -np.inf
+    return values
+
+
+def _constant_runs(rng):
+    """Flat stretches (as in the exchange-rate series) separated by jumps"""
+    levels = np.round(rng.normal(5, 0.3, 12), 4)
+    return np.repeat(levels, rng.integers(1, 40, 12)).astype(float)
+
+
+SERIES = {
+    "random_with_gaps": _random_with_gaps(np.random.default_rng(0)),
+    "constant_runs": _constant_runs(np.random.default_rng(1)),
+    "constant_small": np.full(50, 0.1),
+    "constant_large": np.full(50, 1e8 + 0.1),
+    "shorter_than_window": np.array([1.0, 2.0, 3.0, 2.0, 5.0]),
+}
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def backend(request, monkeypatch):
+    """Runs each test on the compiled kernels and on the forced NumPy fallback"""
+    if request.param == "numba":
+        if not rolling_kernels.NUMBA_AVAILABLE:
+            pytest.skip("numba is not installed")
+    else:
+        monkeypatch.setattr(rolling_kernels, "NUMBA_AVAILABLE", False)
+    return request.param
+
+
+@pytest.mark.parametrize("name", SERIES)
+@pytest.mark.parametrize("window", WINDOWS)
+def test_rolling_median_matches_pandas(backend, name, window):
+    values = SERIES[name]
+    expected = pd.Series(values).rolling(window).median().to_numpy()
+    np.testing.assert_allclose(rolling_median(values, window), expected, rtol=1e-12, equal_nan=True)
+
+
+@pytest.mark.parametrize("name", SERIES)
+@pytest.mark.parametrize("window", WINDOWS)
+def test_rolling_std_matches_pandas(backend, name, window):
+    values = SERIES[name]
+    expected = pd.Series(values).rolling(window).std().to_numpy()
+    # pandas' own add/remove updates leave ~1e-8 residues on flat stretches
+    np.testing.assert_allclose(rolling_std(values, window), expected, rtol=1e-9, atol=1e-7, equal_nan=True)
+
+
+@pytest.mark.parametrize("name", ["constant_small", "constant_large"])
+def test_rolling_std_constant_window_is_exact_zero(backend, name):
+    result = rolling_std(SERIES[name], 10)
+    assert np.all(result[9:] == 0.0)
+
+
+def test_rolling_std_is_stable_on_large_offsets(backend):
+    rng = np.random.default_rng(2)
+    values = 1e8 + rng.normal(0, 1, 2000)
+    windows = np.lib.stride_tricks.sliding_window_view(values.astype(np.longdouble), 2)
+    expected = np.abs(windows[:, 1] - windows[:, 0]) / np.sqrt(2)
+    result = rolling_std(values, 2)[1:]
+    np.testing.assert_allclose(result, expected.astype(float), rtol=1e-7)
+
+
+@pytest.mark.parametrize("func", [rolling_median, rolling_std])
+@pytest.mark.parametrize("window", [0, -1])
+def test_invalid_window_raises(backend, func, window):
+    with pytest.raises(ValueError):
+        func(np.arange(5.0), window)
+
+
+@pytest.mark.parametrize("func", [rolling_median, rolling_std])
+def test_rolling_many_matches_sequential(backend, func):
+    series_list = list(SERIES.values())
+    results = rolling_many(func, series_list, 10, max_workers=4)
+    assert len(results) == len(series_list)
+    for values, result in zip(series_list, results):
+        np.testing.assert_array_equal(result, func(values, 10))